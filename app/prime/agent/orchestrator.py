@@ -7,7 +7,7 @@ endpoints.py hands off here; orchestrator returns AgentResponse.
 
 Loop:
   1. detect_intent()           -> IntentDecision
-  2. load memory + corpus      -> context bundle
+  2. load memory + corpus      -> context bundle (concurrently)
   3. build_chat_messages()     -> formatted message list
   4. chat_with_tools() OR      -> LLMResponse
      chat_or_fallback()
@@ -22,6 +22,7 @@ Design rules:
 
 from __future__ import annotations
 
+import asyncio
 import json
 from datetime import datetime
 from typing import Any, Optional
@@ -87,33 +88,37 @@ async def run_agent(req: AgentRequest) -> AgentResponse:
         route_hint=req.route_hint,
     )
 
-    # 2. Load persistent memory
-    recent_turns = get_recent_context(user_id=req.user_id, limit=10)
-    persistent_history = [
-        {"role": "user", "content": t["user_message"]}
-        if "user_message" in t else
-        {"role": "assistant", "content": t["assistant_msg"]}
-        for t in recent_turns
+    # 2-4. Load persistent memory, corpus + episodes, and context.
+    # The lookups are independent, so they run concurrently; the blocking
+    # loaders go to worker threads to keep the event loop free.
+    from app.prime.context import build_prime_context
+    loads = [
+        asyncio.to_thread(get_recent_context, user_id=req.user_id, limit=10),
+        build_prime_context(
+            message=req.message,
+            session_id=req.session_id,
+        ),
     ]
-
-    # 3. Load corpus + episodes (skip for pure chat to reduce latency)
-    corpus_hits:     list = []
-    memory_episodes: list = []
+    # Corpus + episodes are skipped for pure chat to reduce latency.
     if decision.intent.value != "general_chat":
-        corpus_hits     = search_corpus(req.message, top_k=5)
-        memory_episodes = query_recent_practice_for_user(
+        loads.append(asyncio.to_thread(search_corpus, req.message, top_k=5))
+        loads.append(asyncio.to_thread(
+            query_recent_practice_for_user,
             user_id=req.user_id,
             domain="philosophy",
             subdomain="ethics",
             limit=5,
-        )
+        ))
+    recent_turns, context, *recall = await asyncio.gather(*loads)
+    corpus_hits:     list = recall[0] if recall else []
+    memory_episodes: list = recall[1] if recall else []
 
-    # 4. Build context
-    from app.prime.context import build_prime_context
-    context = await build_prime_context(
-        message=req.message,
-        session_id=req.session_id,
-    )
+    persistent_history = [
+        {"role": "user", "content": t["user_message"]}
+        if "user_message" in t else
+        {"role": "assistant", "content": t["assistant_msg"]}
+        for t in recent_turns
+    ]
 
     # 5. Build LLM messages
     messages = build_chat_messages(
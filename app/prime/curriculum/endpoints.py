@@ -1,4 +1,6 @@
-from fastapi import APIRouter
+from functools import lru_cache
+
+from fastapi import APIRouter, Response
 from pydantic import BaseModel
 
 from app.prime.curriculum.models import SubjectCurriculum
@@ -20,11 +22,12 @@ class CurriculumSnapshotResponse(BaseModel):
     curriculum: CurriculumSnapshot
 
 
-@router.get("/snapshot", response_model=CurriculumSnapshotResponse)
-async def curriculum_snapshot():
+@lru_cache(maxsize=1)
+def _curriculum_snapshot_json() -> bytes:
     """
-    High-level view of PRIME's curriculum across all subjects.
-    Currently includes math foundations and money foundations history.
+    Build and serialize the curriculum snapshot once per process.
+
+    Every subject in the snapshot is static, so the response body never changes.
     """
     math_curriculum: SubjectCurriculum = build_math_foundations_curriculum()
     money_history_curriculum: SubjectCurriculum = (
@@ -38,10 +41,23 @@ async def curriculum_snapshot():
         ]
     )
 
-    return CurriculumSnapshotResponse(
+    response = CurriculumSnapshotResponse(
         description=(
             "PRIME's current curriculum snapshot. Math foundations holds early number sense "
             "lessons; Money Foundations: History of Money holds an overview of how money developed."
         ),
         curriculum=snapshot,
     )
+    return response.model_dump_json().encode()
+
+
+@router.get("/snapshot", response_model=CurriculumSnapshotResponse)
+async def curriculum_snapshot():
+    """
+    High-level view of PRIME's curriculum across all subjects.
+    Currently includes math foundations and money foundations history.
+    """
+    return Response(
+        content=_curriculum_snapshot_json(),
+        media_type="application/json",
+    )
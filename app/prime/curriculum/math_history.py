@@ -1,18 +1,22 @@
+from functools import lru_cache
+
 from app.prime.curriculum.models import (
     SubjectId,
     HistoryEvent,
 )
 
 
-def get_early_numeration_history() -> list[HistoryEvent]:
+_MATH_FOUNDATIONS_ONLY: tuple[SubjectId, ...] = (SubjectId.MATH_FOUNDATIONS,)
+
+
+@lru_cache(maxsize=1)
+def get_early_numeration_history() -> tuple[HistoryEvent, ...]:
     """
     Early human numeration history: from tallies to positional systems and zero.
     """
-    events: list[HistoryEvent] = []
-
-    # 1) Tally marks and simple counts
-    events.append(
-        HistoryEvent(
+    return (
+        # 1) Tally marks and simple counts
+        HistoryEvent.model_construct(
             id="hist_num_tallies",
             title="Tally Marks and Early Counting",
             era="Prehistoric",
@@ -26,16 +30,14 @@ def get_early_numeration_history() -> list[HistoryEvent]:
                 "This is the beginning of written numbers: representing 'how many' with marks, "
                 "even before formal symbols for 1, 2, 3."
             ),
-            related_subjects=[SubjectId.MATH_FOUNDATIONS],
-            related_lessons=[
+            related_subjects=_MATH_FOUNDATIONS_ONLY,
+            related_lessons=(
                 "math_fnd_number_foundations",
-            ],
-        )
-    )
+            ),
+        ),
 
-    # 2) Sumerian and Babylonian numeration (base 60)
-    events.append(
-        HistoryEvent(
+        # 2) Sumerian and Babylonian numeration (base 60)
+        HistoryEvent.model_construct(
             id="hist_num_sumer_babylon",
             title="Sumerian and Babylonian Base-60 Numeration",
             era="Ancient",
@@ -49,17 +51,15 @@ def get_early_numeration_history() -> list[HistoryEvent]:
                 "Their base-60 system influenced how we still measure time (60 seconds, 60 minutes) "
                 "and angles (360 degrees) today."
             ),
-            related_subjects=[SubjectId.MATH_FOUNDATIONS],
-            related_lessons=[
+            related_subjects=_MATH_FOUNDATIONS_ONLY,
+            related_lessons=(
                 "math_fnd_number_foundations",
                 "math_fnd_range_0_100",
-            ],
-        )
-    )
+            ),
+        ),
 
-    # 3) Egyptian numeration (additive)
-    events.append(
-        HistoryEvent(
+        # 3) Egyptian numeration (additive)
+        HistoryEvent.model_construct(
             id="hist_num_egypt",
             title="Egyptian Hieroglyphic Numerals",
             era="Ancient",
@@ -73,16 +73,14 @@ def get_early_numeration_history() -> list[HistoryEvent]:
                 "This system showed a clear idea of units, tens, hundreds, and so on, "
                 "but lacked positional notation like our modern system."
             ),
-            related_subjects=[SubjectId.MATH_FOUNDATIONS],
-            related_lessons=[
+            related_subjects=_MATH_FOUNDATIONS_ONLY,
+            related_lessons=(
                 "math_fnd_range_0_100",
-            ],
-        )
-    )
+            ),
+        ),
 
-    # 4) Greek and Roman numerals
-    events.append(
-        HistoryEvent(
+        # 4) Greek and Roman numerals
+        HistoryEvent.model_construct(
             id="hist_num_greek_roman",
             title="Greek and Roman Numerals",
             era="Classical",
@@ -96,16 +94,14 @@ def get_early_numeration_history() -> list[HistoryEvent]:
                 "These systems were good for writing numbers but made long calculations harder "
                 "than with positional notation."
             ),
-            related_subjects=[SubjectId.MATH_FOUNDATIONS],
-            related_lessons=[
+            related_subjects=_MATH_FOUNDATIONS_ONLY,
+            related_lessons=(
                 "math_fnd_range_0_100",
-            ],
-        )
-    )
+            ),
+        ),
 
-    # 5) Hindu-Arabic numerals and zero
-    events.append(
-        HistoryEvent(
+        # 5) Hindu-Arabic numerals and zero
+        HistoryEvent.model_construct(
             id="hist_num_hindu_arabic_zero",
             title="Hindu-Arabic Numerals and Zero",
             era="Classical to Medieval",
@@ -120,18 +116,16 @@ def get_early_numeration_history() -> list[HistoryEvent]:
                 "This positional base-10 system with zero is the foundation of modern arithmetic. "
                 "It makes operations with integers, decimals, and fractions far easier than earlier systems."
             ),
-            related_subjects=[SubjectId.MATH_FOUNDATIONS],
-            related_lessons=[
+            related_subjects=_MATH_FOUNDATIONS_ONLY,
+            related_lessons=(
                 "math_fnd_counting_0_10",
                 "math_fnd_range_0_100",
                 "math_fnd_decimals_basic",
-            ],
-        )
-    )
+            ),
+        ),
 
-    # 6) Decimal fractions in everyday calculation
-    events.append(
-        HistoryEvent(
+        # 6) Decimal fractions in everyday calculation
+        HistoryEvent.model_construct(
             id="hist_num_decimal_fractions",
             title="Decimal Fractions in Calculation",
             era="Early Modern",
@@ -145,12 +139,10 @@ def get_early_numeration_history() -> list[HistoryEvent]:
                 "Decimal fractions link naturally to money (like dollars and cents) and to "
                 "measurement, making calculations more straightforward."
             ),
-            related_subjects=[SubjectId.MATH_FOUNDATIONS],
-            related_lessons=[
+            related_subjects=_MATH_FOUNDATIONS_ONLY,
+            related_lessons=(
                 "math_fnd_money_fractions",
                 "math_fnd_decimals_basic",
-            ],
-        )
+            ),
+        ),
     )
-
-    return events
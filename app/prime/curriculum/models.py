@@ -1,9 +1,10 @@
 from enum import Enum
-from typing import Any, List, Optional, Literal
+from functools import cached_property
+from typing import Any, List, Optional, Literal, TypedDict
 
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 # ============================================================
@@ -75,6 +76,8 @@ class LessonKind(str, Enum):
 
 
 class HistoryEra(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     label: str              # e.g., "Ancient", "Classical", "Medieval", "Modern"
     start_year: int | None  # BCE negative, CE positive, None if very approximate
     end_year: int | None
@@ -82,6 +85,8 @@ class HistoryEra(BaseModel):
 
 
 class HistoryEvent(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     title: str
     era: str                # simple label, e.g., "Ancient", "Classical"
@@ -89,14 +94,16 @@ class HistoryEvent(BaseModel):
     location: str           # e.g., "Mesopotamia", "China"
     description: str
     significance: str
-    related_subjects: list[SubjectId]
-    related_lessons: list[str]  # lesson ids this event connects to
+    related_subjects: tuple[SubjectId, ...]
+    related_lessons: tuple[str, ...]  # lesson ids this event connects to
 
 
 class LessonRef(BaseModel):
     """
     Lightweight reference to a lesson inside a subject.
     """
+    model_config = ConfigDict(frozen=True)
+
     lesson_id: str
     title: str
     kind: LessonKind
@@ -108,6 +115,8 @@ class Lesson(BaseModel):
     Generic lesson container; 'content' can embed subject-specific structures.
     For math, this will include our number_sense structures.
     """
+    model_config = ConfigDict(frozen=True)
+
     id: str
     subject: SubjectId
     title: str
@@ -125,6 +134,8 @@ class SubjectCurriculum(BaseModel):
     """
     All lessons for a single subject, plus metadata and recommended order.
     """
+    model_config = ConfigDict(frozen=True)
+
     subject: SubjectId
     name: str
     description: str
@@ -135,6 +146,13 @@ class SubjectCurriculum(BaseModel):
     domain: DomainId | None = None
     default_level: CurriculumLevel | None = None
 
+    @cached_property
+    def lessons_by_id(self) -> dict[str, Lesson]:
+        """
+        Lessons keyed by id, built on first access.
+        """
+        return {lesson.id: lesson for lesson in self.lessons}
+
 
 class CurriculumSnapshot(BaseModel):
     """
@@ -197,6 +215,8 @@ class PhilosophySyllabusUnit(BaseModel):
     """
     A single unit in PRIME's philosophy ladder at any level.
     """
+    model_config = ConfigDict(frozen=True)
+
     id: str  # e.g., "hs.ethics.core_lenses" or "un.ethics.normative_theory"
     level: PhilosophySyllabusLevel
     branch: Literal[
@@ -214,13 +234,13 @@ class PhilosophySyllabusUnit(BaseModel):
     ]
     title: str
     short_description: str
-    core_questions: list[str]
-    key_concepts: list[str]
-    canonical_practice_endpoints: list[str]
+    core_questions: tuple[str, ...]
+    key_concepts: tuple[str, ...]
+    canonical_practice_endpoints: tuple[str, ...]
 
     # Ladder structure
-    prerequisites: list[str] = []        # ids of prior units (possibly at lower levels)
-    recommended_next_units: list[str] = []  # ids of next units PRIME should progress to
+    prerequisites: tuple[str, ...] = ()        # ids of prior units (possibly at lower levels)
+    recommended_next_units: tuple[str, ...] = ()  # ids of next units PRIME should progress to
 
 
 class PhilosophySyllabusLadder(BaseModel):
@@ -233,6 +253,8 @@ class PhilosophyMetaMapItem(BaseModel):
     """
     Connect a specific HS or UN philosophy syllabus unit to DR-level pillars and frontier questions.
     """
+    model_config = ConfigDict(frozen=True)
+
     unit_id: str
     level: str
     branch: str
@@ -244,18 +266,7 @@ class PhilosophyMetaMapItem(BaseModel):
 class PhilosophyMetaMapResponse(BaseModel):
     meta_map: PhilosophyMetaMapItem
 
-class PhilosophyWarmupBranch(str):
-    ETHICS = "ethics"
-    EPISTEMOLOGY = "epistemology"
-    METAPHYSICS = "metaphysics"
-    LOGIC = "logic"
-    POLITICAL = "political"
-    HISTORY = "history"
-    MIND_AI = "mind_ai"
-    WORLD = "world"
-    APPLIED = "applied"
-
-class PhilosophyWarmupBranch(str):
+class PhilosophyWarmupBranch(str, Enum):
     ETHICS = "ethics"
     EPISTEMOLOGY = "epistemology"
     METAPHYSICS = "metaphysics"
@@ -267,14 +278,6 @@ class PhilosophyWarmupBranch(str):
     APPLIED = "applied"
 
 
-class PhilosophyWarmupItem(BaseModel):
-    id: str  # e.g., "hs.ethics.stakeholders_and_harms.w1"
-    level: Literal["hs"]
-    branch: str  # one of PhilosophyWarmupBranch values
-    syllabus_unit_id: str  # links into PHILOSOPHY_SYLLABUS_LADDER
-    prompt: str  # short teacher-facing warmup prompt
-    suggested_practice_endpoint: str  # one HS practice endpoint
-
 class PhilosophyWarmupItem(BaseModel):
     id: str  # e.g., "hs.ethics.stakeholders_and_harms.w1"
     level: Literal["hs"]
@@ -391,60 +394,6 @@ class K8EthicsPracticeRequest(BaseModel):
     answer_text: str | None = None
 
 
-class K8EthicsPracticeResponse(BaseModel):
-    """
-    PRIME's response: restate, gently frame fairness/harm/trust,
-    and invite further reflection.
-    """
-    story_kind: K8EthicsStoryKind
-    story: str
-    child_answer: str | None
-    prime_paraphrase: str
-    prime_feedback: str
-    follow_up_question: str
-
-class K8LogicPracticeItemKind(str, Enum):
-    SPOT_REASON_VS_CONCLUSION = "spot_reason_vs_conclusion"
-    IS_THAT_A_REASON = "is_that_a_reason"
-    EVERYONE_DOES_IT = "everyone_does_it"
-    FREE_FORM_BELIEF_AND_REASON = "free_form_belief_and_reason"
-
-
-class K8LogicPracticeRequest(BaseModel):
-    """
-    K–8 logic practice: very small exercises for reasons vs conclusions
-    and simple bad moves.
-    """
-    item_kind: K8LogicPracticeItemKind
-    answer_text: str | None = None
-
-
-class K8LogicPracticeResponse(BaseModel):
-    """
-    PRIME's response: restate, gently classify, and invite reflection.
-    """
-    item_kind: K8LogicPracticeItemKind
-    prompt: str
-    child_answer: str | None
-    prime_paraphrase: str
-    prime_feedback: str
-    follow_up_question: str
-
-
-class K8EthicsStoryKind(str, Enum):
-    SHARING_SNACKS = "sharing_snacks"
-    TEST_ANSWER = "test_answer"
-    BROKEN_PROMISE = "broken_promise"
-
-
-class K8EthicsPracticeRequest(BaseModel):
-    """
-    K–8 ethics practice: micro-stories about fairness, harm, and promises.
-    """
-    story_kind: K8EthicsStoryKind
-    answer_text: str | None = None
-
-
 class K8EthicsPracticeResponse(BaseModel):
     """
     PRIME's response: restate, gently frame fairness/harm/trust,
@@ -503,7 +452,7 @@ class K8WorldPlannerResponse(BaseModel):
     Bundles the world lesson with a world practice response.
     """
     original_question: str
-    lesson: dict  # serialized PhilosophyLesson
+    lesson: PhilosophyLesson
     practice: K8WorldPracticeResponse
 
 
@@ -544,7 +493,7 @@ class K8MindPlannerResponse(BaseModel):
     Bundles the mind/self lesson with a mind practice response.
     """
     original_question: str
-    lesson: dict  # serialized PhilosophyLesson
+    lesson: PhilosophyLesson
     practice: K8MindPracticeResponse
 
 
@@ -587,7 +536,7 @@ class K8LogicPlannerResponse(BaseModel):
     Bundles the K–8 logic lesson with a logic practice response.
     """
     original_question: str
-    lesson: dict  # serialized PhilosophyLesson
+    lesson: PhilosophyLesson
     practice: K8LogicPracticeResponse
 
 
@@ -603,7 +552,7 @@ class K8EthicsPlannerResponse(BaseModel):
     Bundles the K–8 ethics lesson with an ethics practice response.
     """
     original_question: str
-    lesson: dict  # serialized PhilosophyLesson
+    lesson: PhilosophyLesson
     practice: K8EthicsPracticeResponse
 
 class K8TeacherViewMode(str, Enum):
@@ -765,25 +714,29 @@ class PhilosophyBranchPracticeResponse(BaseModel):
     next_step_suggestion: str
 
 class PhilosophyFigure(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     birth_year: Optional[int] = None
     death_year: Optional[int] = None
     region: Optional[str] = None
-    traditions: list[str] = []
-    main_works: list[str] = []  # work ids
-    main_ideas: list[str] = []  # idea ids
+    traditions: tuple[str, ...] = ()
+    main_works: tuple[str, ...] = ()  # work ids
+    main_ideas: tuple[str, ...] = ()  # idea ids
 
 
 class PhilosophyIdea(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     label: str
     branch: PhilosophyBranch
     summary: str
-    key_claims: list[str] = []
-    supporting_figures: list[str] = []  # figure ids
-    opposing_figures: list[str] = []
-    rival_ideas: list[str] = []         # idea ids
+    key_claims: tuple[str, ...] = ()
+    supporting_figures: tuple[str, ...] = ()  # figure ids
+    opposing_figures: tuple[str, ...] = ()
+    rival_ideas: tuple[str, ...] = ()         # idea ids
 
 # ============================================================
 # Philosophy Lane 3: Ethics I (intro normative frameworks)
@@ -901,7 +854,7 @@ class ConsequentialismVariant(str, Enum):
     OTHER = "other"
 
 
-class EthicsConsequentialismTeachEntry(BaseModel):
+class EthicsConsequentialismTeachEntry(TypedDict):
     """
     Teaching entry for a core idea or variant within consequentialism.
     """
@@ -966,7 +919,7 @@ class DeontologyVariant(str, Enum):
     OTHER = "other"
 
 
-class EthicsDeontologyTeachEntry(BaseModel):
+class EthicsDeontologyTeachEntry(TypedDict):
     """
     Teaching entry for a core idea or variant within deontological ethics.
     """
@@ -1031,7 +984,7 @@ class VirtueEthicsVariant(str, Enum):
     OTHER = "other"
 
 
-class EthicsVirtueTeachEntry(BaseModel):
+class EthicsVirtueTeachEntry(TypedDict):
     """
     Teaching entry for a core idea or variant within virtue ethics.
     """
@@ -1095,7 +1048,7 @@ class CareEthicsVariant(str, Enum):
     OTHER = "other"
 
 
-class EthicsCareTeachEntry(BaseModel):
+class EthicsCareTeachEntry(TypedDict):
     """
     Teaching entry for a core idea or variant within care / relational ethics.
     """
@@ -1217,11 +1170,15 @@ class EthicsMetaPerspectivesResponse(BaseModel):
 
 
 class EthicsConceptDimension(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
 
 
 class EthicsConceptExample(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     title: str
     description: str
@@ -1229,21 +1186,25 @@ class EthicsConceptExample(BaseModel):
 
 
 class EthicsConceptFrameworkView(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     framework: EthicsFramework
     headline: str
     characterization: str
-    tensions: List[str] = []
+    tensions: tuple[str, ...] = ()
 
 
 class EthicsConcept(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     working_definition: str
-    dimensions: List[EthicsConceptDimension] = []
-    examples: List[EthicsConceptExample] = []
-    contrast_concepts: List[str] = []
-    framework_views: List[EthicsConceptFrameworkView] = []
-    notes: List[str] = []
+    dimensions: tuple[EthicsConceptDimension, ...] = ()
+    examples: tuple[EthicsConceptExample, ...] = ()
+    contrast_concepts: tuple[str, ...] = ()
+    framework_views: tuple[EthicsConceptFrameworkView, ...] = ()
+    notes: tuple[str, ...] = ()
 
 
 class EthicsConceptDiagnosisRequest(BaseModel):
@@ -1490,17 +1451,6 @@ class MethodsConceptLesson(BaseModel):
     """
     Full lesson bundle for a single methods concept.
     """
-    id: str
-    concept: MethodsConcept
-    subject: SubjectId
-    domain: DomainId
-    level: CurriculumLevel
-    professor_view: MethodsConceptLessonProfessorView
-    grad_view: MethodsConceptLessonGradView
-    teacher_view: MethodsConceptLessonTeacherView
-    practice: MethodsConceptPracticeSet
-
-class MethodsConceptLesson(BaseModel):
     id: str
     concept: MethodsConcept
     subject: SubjectId = SubjectId.PHILOSOPHY_CORE
@@ -1574,17 +1524,6 @@ class MetaphysicsConceptLesson(BaseModel):
     """
     Full lesson bundle for a single metaphysics concept.
     """
-    id: str
-    concept: MetaphysicsConcept
-    subject: SubjectId
-    domain: DomainId
-    level: CurriculumLevel
-    professor_view: MetaphysicsConceptLessonProfessorView
-    grad_view: MetaphysicsConceptLessonGradView
-    teacher_view: MetaphysicsConceptLessonTeacherView
-    practice: MetaphysicsConceptPracticeSet
-
-class MetaphysicsConceptLesson(BaseModel):
     id: str
     concept: MetaphysicsConcept
     subject: SubjectId = SubjectId.PHILOSOPHY_CORE
@@ -1619,6 +1558,8 @@ class ReasoningToolCall(BaseModel):
     A single tool call the reasoning core can make to PRIME's internal corpus.
     For now, we model it abstractly; concrete layers decide how to route it.
     """
+    model_config = ConfigDict(frozen=True)
+
     name: str  # e.g., "philosophy_four_lens", "math_solver"
     input_payload: dict[str, Any]
 
@@ -1635,6 +1576,8 @@ class ReasoningTask(BaseModel):
     """
     Canonical schema for a reasoning problem, across all domains.
     """
+    model_config = ConfigDict(frozen=True)
+
     task_id: str
     natural_language_task: str
 
@@ -1667,14 +1610,16 @@ class ReasoningStep(BaseModel):
     """
     One internal step of the reasoning core's multi-step loop.
     """
+    model_config = ConfigDict(frozen=True)
+
     index: int
     kind: ReasoningStepKind
     description: str  # what this step is trying to do, in human-readable terms
-    inputs: list[str] = []  # references to previous steps or facts
-    outputs: list[str] = []  # statements, intermediate conclusions, or notes
+    inputs: tuple[str, ...] = ()  # references to previous steps or facts
+    outputs: tuple[str, ...] = ()  # statements, intermediate conclusions, or notes
     tool_call: ReasoningToolCall | None = None  # populated if this step calls a tool
     tool_result_summary: str | None = None  # short summary of what the tool returned
-    warnings: list[str] = []  # e.g., "possible contradiction", "low confidence"
+    warnings: tuple[str, ...] = ()  # e.g., "possible contradiction", "low confidence"
     confidence: float | None = None  # optional 0.0 - 1.0
 
 
@@ -1682,10 +1627,12 @@ class ReasoningTrace(BaseModel):
     """
     Full reasoning trace: ordered steps plus any global flags.
     """
+    model_config = ConfigDict(frozen=True)
+
     steps: list[ReasoningStep]
     overall_confidence: float | None = None
-    detected_contradictions: list[str] = []
-    notes: list[str] = []
+    detected_contradictions: tuple[str, ...] = ()
+    notes: tuple[str, ...] = ()
 
 
 class ReasoningCoreRequest(BaseModel):
@@ -1893,10 +1840,46 @@ class MathSubfield(str, Enum):
     PHD_SPEC_STATISTICS_BIOSTAT = "phd_spec_statistics_biostat"
 
 
+class MathConceptId(str, Enum):
+    # Number & arithmetic foundations
+    ZERO = "math_concept_zero"
+    ONE = "math_concept_one"
+    NATURAL_NUMBERS = "math_concept_natural_numbers"
+    NEGATIVE_NUMBERS = "math_concept_negative_numbers"
+    INTEGERS = "math_concept_integers"
+    ADDITION = "math_concept_addition"
+    SUBTRACTION = "math_concept_subtraction"
+    LESS_THAN = "math_concept_less_than"
+    GREATER_THAN = "math_concept_greater_than"
+    EQUAL_TO = "math_concept_equal_to"
+
+    # Prealgebra & early algebra
+    EXPRESSION = "math_concept_expression"
+    EQUATION = "math_concept_equation"
+    UNKNOWN = "math_concept_unknown"
+    SOLVE_EQUATION = "math_concept_solve_equation"
+
+    # School geometry
+    POINT = "math_concept_point"
+    LINE = "math_concept_line"
+    LINE_SEGMENT = "math_concept_line_segment"
+    RAY = "math_concept_ray"
+    ANGLE = "math_concept_angle"
+    TRIANGLE = "math_concept_triangle"
+    SQUARE = "math_concept_square"
+    RIGHT_ANGLE = "math_concept_right_angle"
+    ACUTE_ANGLE = "math_concept_acute_angle"
+    OBTUSE_ANGLE = "math_concept_obtuse_angle"
+    PERIMETER = "math_concept_perimeter"
+    AREA = "math_concept_area"
+
+
 class MathExample(BaseModel):
     """
     A concrete example or counterexample of a math concept.
     """
+    model_config = ConfigDict(frozen=True)
+
     name: str                  # Short label for the example
     description: str           # Explanation in plain language
     is_counterexample: bool    # True if this is a counterexample
@@ -1907,24 +1890,28 @@ class MathConcept(BaseModel):
     """
     A single mathematical concept with vocabulary, examples, and history hooks.
     """
-    id: str                             # Unique id, e.g., "math_concept_zero"
+    model_config = ConfigDict(frozen=True)
+
+    id: MathConceptId                   # Unique id, e.g., "math_concept_zero"
     name: str                           # Human-readable name, e.g., "Zero"
     level: MathLevel                    # Overall depth band
     subfield: MathSubfield              # Where in the math universe it belongs
     definition: str                     # Core definition in plain language
-    synonyms: list[str]                 # Alternative names, common phrases
-    common_notation: list[str]         # Typical symbols / notations (e.g., "0", "ℕ")
-    examples: list[MathExample]        # Canonical examples (5–7 over time)
+    synonyms: tuple[str, ...]           # Alternative names, common phrases
+    common_notation: tuple[str, ...]   # Typical symbols / notations (e.g., "0", "ℕ")
+    examples: tuple[MathExample, ...]  # Canonical examples (5–7 over time)
     historical_notes: str | None = None  # Short history / origin notes
-    related_concepts: list[str] = []   # IDs of related MathConcepts
+    related_concepts: tuple[MathConceptId, ...] = ()  # IDs of related MathConcepts
 
 
 class MathTeachingStep(BaseModel):
     """
     A single step in a teaching path over math concepts.
     """
+    model_config = ConfigDict(frozen=True)
+
     order: int                          # 1, 2, 3, ...
-    concept_id: str                     # e.g., "math_concept_zero"
+    concept_id: MathConceptId           # e.g., "math_concept_zero"
     headline: str                       # Short label, e.g., "Start at Zero"
     rationale: str                      # Why this step comes here in the path
 
@@ -1933,9 +1920,11 @@ class MathTeachingPath(BaseModel):
     """
     An ordered path through math concepts with explanations.
     """
+    model_config = ConfigDict(frozen=True)
+
     id: str                             # e.g., "number_arithmetic_foundations"
     level: MathLevel
     subfield: MathSubfield
     title: str
     description: str
-    steps: list[MathTeachingStep]
\ No newline at end of file
+    steps: tuple[MathTeachingStep, ...]
\ No newline at end of file
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from app.prime.curriculum.models import (
     SubjectId,
     DifficultyLevel,
@@ -10,9 +12,13 @@ from app.prime.curriculum.models import (
 from app.prime.curriculum.money_history import get_history_of_money
 
 
+@lru_cache(maxsize=1)
 def build_money_foundations_history_curriculum() -> SubjectCurriculum:
     """
     Curriculum for the Money Foundations: History of Money subject.
+
+    The curriculum is static, so it is built once per process and shared;
+    callers must treat the returned object as read-only.
     """
     events = get_history_of_money()
 
@@ -27,7 +33,7 @@ def build_money_foundations_history_curriculum() -> SubjectCurriculum:
             "banks, and modern digital systems."
         ),
         content={
-            "events": [ev.model_dump() for ev in events],
+            "events": [ev.model_dump(mode="json") for ev in events],
         },
     )
 
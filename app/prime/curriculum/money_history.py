@@ -1,15 +1,30 @@
+from functools import lru_cache
+
 from app.prime.curriculum.models import SubjectId, HistoryEvent
 
 
-def get_history_of_money() -> list[HistoryEvent]:
+_MONEY_HISTORY_ONLY: tuple[SubjectId, ...] = (SubjectId.MONEY_FOUNDATIONS_HISTORY,)
+
+# Lesson links shared by several events.
+_FRACTIONS_DECIMALS_WORD_PROBLEMS: tuple[str, ...] = (
+    "math_fnd_money_fractions",
+    "math_fnd_decimals_basic",
+    "math_fnd_word_problems_money_basic",
+)
+_DECIMALS_WORD_PROBLEMS: tuple[str, ...] = (
+    "math_fnd_decimals_basic",
+    "math_fnd_word_problems_money_basic",
+)
+
+
+@lru_cache(maxsize=1)
+def get_history_of_money() -> tuple[HistoryEvent, ...]:
     """
     History of money from early exchange and barter to modern digital forms.
     """
-    events: list[HistoryEvent] = []
-
-    # 1) Early exchange and barter
-    events.append(
-        HistoryEvent(
+    return (
+        # 1) Early exchange and barter
+        HistoryEvent.model_construct(
             id="money_hist_barter",
             title="Early Exchange and Barter",
             era="Prehistoric / Ancient",
@@ -24,14 +39,12 @@ def get_history_of_money() -> list[HistoryEvent]:
                 "Barter works for simple trades but makes it hard to compare values, store value "
                 "over time, or make change. These problems pushed societies toward creating money."
             ),
-            related_subjects=[SubjectId.MONEY_FOUNDATIONS_HISTORY],
-            related_lessons=[],
-        )
-    )
+            related_subjects=_MONEY_HISTORY_ONLY,
+            related_lessons=(),
+        ),
 
-    # 2) Commodity money
-    events.append(
-        HistoryEvent(
+        # 2) Commodity money
+        HistoryEvent.model_construct(
             id="money_hist_commodity",
             title="Commodity Money",
             era="Ancient",
@@ -46,14 +59,12 @@ def get_history_of_money() -> list[HistoryEvent]:
                 "Commodity money was a first step toward commonly accepted things that represent value. "
                 "However, these items could be bulky, hard to divide evenly, or vary in quality."
             ),
-            related_subjects=[SubjectId.MONEY_FOUNDATIONS_HISTORY],
-            related_lessons=[],
-        )
-    )
+            related_subjects=_MONEY_HISTORY_ONLY,
+            related_lessons=(),
+        ),
 
-    # 3) Early metal money and coins
-    events.append(
-        HistoryEvent(
+        # 3) Early metal money and coins
+        HistoryEvent.model_construct(
             id="money_hist_early_coins",
             title="Early Metal Money and Coins",
             era="Ancient",
@@ -69,18 +80,12 @@ def get_history_of_money() -> list[HistoryEvent]:
                 "allowed people to make change and price goods more precisely, much like using discrete "
                 "dollar and cent amounts today."
             ),
-            related_subjects=[SubjectId.MONEY_FOUNDATIONS_HISTORY],
-            related_lessons=[
-                "math_fnd_money_fractions",
-                "math_fnd_decimals_basic",
-                "math_fnd_word_problems_money_basic",
-            ],
-        )
-    )
+            related_subjects=_MONEY_HISTORY_ONLY,
+            related_lessons=_FRACTIONS_DECIMALS_WORD_PROBLEMS,
+        ),
 
-    # 4) Classical and medieval coin economies
-    events.append(
-        HistoryEvent(
+        # 4) Classical and medieval coin economies
+        HistoryEvent.model_construct(
             id="money_hist_classical_coins",
             title="Classical and Medieval Coin Economies",
             era="Classical to Medieval",
@@ -95,17 +100,15 @@ def get_history_of_money() -> list[HistoryEvent]:
                 "taxes. Issues like coin debasement (reducing the precious metal content) showed how "
                 "political choices could affect the value of money."
             ),
-            related_subjects=[SubjectId.MONEY_FOUNDATIONS_HISTORY],
-            related_lessons=[
+            related_subjects=_MONEY_HISTORY_ONLY,
+            related_lessons=(
                 "math_fnd_money_fractions",
                 "math_fnd_word_problems_money_basic",
-            ],
-        )
-    )
+            ),
+        ),
 
-    # 5) Early paper money
-    events.append(
-        HistoryEvent(
+        # 5) Early paper money
+        HistoryEvent.model_construct(
             id="money_hist_paper_early",
             title="Early Paper Money",
             era="Medieval to Early Modern",
@@ -121,18 +124,12 @@ def get_history_of_money() -> list[HistoryEvent]:
                 "note denominations made it natural to think in units like 1, 5, 10, or 100, much like "
                 "today's dollar bills and decimal amounts."
             ),
-            related_subjects=[SubjectId.MONEY_FOUNDATIONS_HISTORY],
-            related_lessons=[
-                "math_fnd_money_fractions",
-                "math_fnd_decimals_basic",
-                "math_fnd_word_problems_money_basic",
-            ],
-        )
-    )
+            related_subjects=_MONEY_HISTORY_ONLY,
+            related_lessons=_FRACTIONS_DECIMALS_WORD_PROBLEMS,
+        ),
 
-    # 6) Banks and banknotes
-    events.append(
-        HistoryEvent(
+        # 6) Banks and banknotes
+        HistoryEvent.model_construct(
             id="money_hist_banks_banknotes",
             title="Banks and Banknotes",
             era="Early Modern",
@@ -148,17 +145,12 @@ def get_history_of_money() -> list[HistoryEvent]:
                 "distance. Banknotes were easier to move than large amounts of coins and became a central "
                 "part of national money systems."
             ),
-            related_subjects=[SubjectId.MONEY_FOUNDATIONS_HISTORY],
-            related_lessons=[
-                "math_fnd_decimals_basic",
-                "math_fnd_word_problems_money_basic",
-            ],
-        )
-    )
+            related_subjects=_MONEY_HISTORY_ONLY,
+            related_lessons=_DECIMALS_WORD_PROBLEMS,
+        ),
 
-    # 7) Gold and silver standards and their decline
-    events.append(
-        HistoryEvent(
+        # 7) Gold and silver standards and their decline
+        HistoryEvent.model_construct(
             id="money_hist_gold_silver_standards",
             title="Gold and Silver Standards and Their Decline",
             era="Modern",
@@ -173,16 +165,14 @@ def get_history_of_money() -> list[HistoryEvent]:
                 "Moving from metal-backed money to fiat money meant that the value of money depended more "
                 "on trust in governments and central banks than on holding gold or silver reserves."
             ),
-            related_subjects=[SubjectId.MONEY_FOUNDATIONS_HISTORY],
-            related_lessons=[
+            related_subjects=_MONEY_HISTORY_ONLY,
+            related_lessons=(
                 "math_fnd_decimals_basic",
-            ],
-        )
-    )
+            ),
+        ),
 
-    # 8) Electronic and digital money
-    events.append(
-        HistoryEvent(
+        # 8) Electronic and digital money
+        HistoryEvent.model_construct(
             id="money_hist_electronic",
             title="Electronic and Digital Money",
             era="Late Modern",
@@ -197,17 +187,12 @@ def get_history_of_money() -> list[HistoryEvent]:
                 "Money became more abstract and less tied to physical objects. Balances, transfers, and "
                 "prices still rely on decimals and fractions, but the 'tokens' are now digital records."
             ),
-            related_subjects=[SubjectId.MONEY_FOUNDATIONS_HISTORY],
-            related_lessons=[
-                "math_fnd_decimals_basic",
-                "math_fnd_word_problems_money_basic",
-            ],
-        )
-    )
+            related_subjects=_MONEY_HISTORY_ONLY,
+            related_lessons=_DECIMALS_WORD_PROBLEMS,
+        ),
 
-    # 9) Modern digital payments and beyond
-    events.append(
-        HistoryEvent(
+        # 9) Modern digital payments and beyond
+        HistoryEvent.model_construct(
             id="money_hist_modern_digital",
             title="Modern Digital Payments and Beyond",
             era="Contemporary",
@@ -222,12 +207,7 @@ def get_history_of_money() -> list[HistoryEvent]:
                 "These systems build directly on decimal-based money and electronic records, and they set "
                 "the stage for future lessons about economics, investing, and how financial systems work."
             ),
-            related_subjects=[SubjectId.MONEY_FOUNDATIONS_HISTORY],
-            related_lessons=[
-                "math_fnd_decimals_basic",
-                "math_fnd_word_problems_money_basic",
-            ],
-        )
+            related_subjects=_MONEY_HISTORY_ONLY,
+            related_lessons=_DECIMALS_WORD_PROBLEMS,
+        ),
     )
-
-    return events
@@ -3,6 +3,18 @@ from __future__ import annotations
 from app.prime.curriculum.models import ReasoningOutcomeQuality
 
 
+# Accuracy bands in twentieths (5% steps): index i covers accuracy in
+# [i/20, (i+1)/20). GOOD starts at 17/20 (85%), MIXED at 10/20 (50%).
+_BANDS: tuple[ReasoningOutcomeQuality, ...] = tuple(
+    ReasoningOutcomeQuality.GOOD
+    if i >= 17
+    else ReasoningOutcomeQuality.MIXED
+    if i >= 10
+    else ReasoningOutcomeQuality.BAD
+    for i in range(21)
+)
+
+
 def compute_outcome_quality_from_answers(
     num_questions: int,
     num_correct: int,
@@ -16,10 +28,9 @@ def compute_outcome_quality_from_answers(
     if num_questions <= 0:
         return ReasoningOutcomeQuality.UNKNOWN
 
-    accuracy = num_correct / num_questions
-
-    if accuracy >= 0.85:
+    # Out-of-range counts land on the end bands, as the accuracy ratio did.
+    if num_correct >= num_questions:
         return ReasoningOutcomeQuality.GOOD
-    if accuracy >= 0.5:
-        return ReasoningOutcomeQuality.MIXED
-    return ReasoningOutcomeQuality.BAD
+    if num_correct <= 0:
+        return ReasoningOutcomeQuality.BAD
+    return _BANDS[(num_correct * 20) // num_questions]
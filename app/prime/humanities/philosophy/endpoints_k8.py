@@ -1095,9 +1095,9 @@ async def philosophy_k8_mind_self_planner(
     practice_req = K8MindPracticeRequest(question_text=request.question_text)
     practice_resp = await philosophy_k8_mind_self_practice(practice_req)
 
-    return K8MindPlannerResponse(
+    return K8MindPlannerResponse.model_construct(
         original_question=request.question_text,
-        lesson=lesson.model_dump(),
+        lesson=lesson,
         practice=practice_resp,
     )
 
@@ -1119,9 +1119,9 @@ async def philosophy_k8_world_reality_planner(
     practice_req = K8WorldPracticeRequest(question_text=request.question_text)
     practice_resp = await philosophy_k8_world_reality_practice(practice_req)
 
-    return K8WorldPlannerResponse(
+    return K8WorldPlannerResponse.model_construct(
         original_question=request.question_text,
-        lesson=lesson.model_dump(),
+        lesson=lesson,
         practice=practice_resp,
     )
 
@@ -1361,7 +1361,7 @@ async def philosophy_k8_planner(
                 K8MindPracticeRequest(question_text=text)
             )
 
-    return K8PhilosophyPlannerResponse(
+    return K8PhilosophyPlannerResponse.model_construct(
         original_question=text,
         chosen_lane=chosen_lane,
         lesson_id=lesson_id,
@@ -1506,9 +1506,9 @@ async def philosophy_k8_ethics_values_planner(
     )
     practice_resp = await philosophy_k8_ethics_values_practice(practice_req)
 
-    return K8EthicsPlannerResponse(
+    return K8EthicsPlannerResponse.model_construct(
         original_question=request.question_text,
-        lesson=lesson.model_dump(),
+        lesson=lesson,
         practice=practice_resp,
     )
 
@@ -2159,7 +2159,7 @@ async def philosophy_ethics_l3_care_teach() -> EthicsCareTeachLesson:
         "Context and particularity: What good care requires is highly context-dependent; it resists simple one-size-fits-all rules.",
     ]
 
-    variants: list[dict[str, Any]] = [
+    variants: list[EthicsCareTeachEntry] = [
         EthicsCareTeachEntry(
             title="Feminist Ethics of Care",
             description=(
@@ -2179,7 +2179,7 @@ async def philosophy_ethics_l3_care_teach() -> EthicsCareTeachLesson:
                 "Risk of reinforcing traditional gender roles if care expectations fall mostly on women or marginalized people.",
                 "Concerns that a focus on close relationships might slide into favoritism or neglect of distant others and structural injustice.",
             ],
-        ).model_dump(),
+        ),
         EthicsCareTeachEntry(
             title="Confucian and Role-Based Relational Ethics",
             description=(
@@ -2199,7 +2199,7 @@ async def philosophy_ethics_l3_care_teach() -> EthicsCareTeachLesson:
                 "Historical role structures can encode hierarchy and gender inequality, which need critical examination.",
                 "Tension between role-based partiality and more egalitarian or rights-based ideals.",
             ],
-        ).model_dump(),
+        ),
         EthicsCareTeachEntry(
             title="Global and Structural Care Ethics",
             description=(
@@ -2219,7 +2219,7 @@ async def philosophy_ethics_l3_care_teach() -> EthicsCareTeachLesson:
                 "Can seem broad and hard to translate into precise policy rules.",
                 "Needs to guard against paternalism: helping in ways that override the voices and agency of those receiving care.",
             ],
-        ).model_dump(),
+        ),
     ]
 
     strengths = [
@@ -2459,7 +2459,7 @@ async def philosophy_ethics_l3_consequentialism_teach() -> EthicsConsequentialis
         "Maximization: We should, as far as possible, choose the option that produces the best overall balance of good over bad.",
     ]
 
-    variants: list[dict[str, Any]] = [
+    variants: list[EthicsConsequentialismTeachEntry] = [
         EthicsConsequentialismTeachEntry(
             title="Act Consequentialism",
             description=(
@@ -2480,7 +2480,7 @@ async def philosophy_ethics_l3_consequentialism_teach() -> EthicsConsequentialis
                 "Can undermine trust if people suspect rules and promises will be broken whenever it seems beneficial.",
                 "Very demanding: seems to require constant calculation and great personal sacrifice.",
             ],
-        ).model_dump(),
+        ),
         EthicsConsequentialismTeachEntry(
             title="Rule Consequentialism",
             description=(
@@ -2499,7 +2499,7 @@ async def philosophy_ethics_l3_consequentialism_teach() -> EthicsConsequentialis
                 "Risk of 'rule worship': following rules even when breaking them would clearly improve outcomes.",
                 "Difficult questions about which set of rules really maximizes overall good.",
             ],
-        ).model_dump(),
+        ),
         EthicsConsequentialismTeachEntry(
             title="Two-Level or 'Softened' Consequentialism",
             description=(
@@ -2518,7 +2518,7 @@ async def philosophy_ethics_l3_consequentialism_teach() -> EthicsConsequentialis
                 "Unclear when to switch from intuitive to critical level.",
                 "May still inherit classic objections if critical-level reasoning approves troubling actions.",
             ],
-        ).model_dump(),
+        ),
     ]
 
     strengths = [
@@ -2577,7 +2577,7 @@ async def philosophy_ethics_l3_deontology_teach() -> EthicsDeontologyTeachLesson
         "Respect for persons: We must treat people as ends in themselves, not merely as means to our own goals.",
     ]
 
-    variants: list[dict[str, Any]] = [
+    variants: list[EthicsDeontologyTeachEntry] = [
         EthicsDeontologyTeachEntry(
             title="Kantian Deontology (Duty and Categorical Imperative)",
             description=(
@@ -2597,7 +2597,7 @@ async def philosophy_ethics_l3_deontology_teach() -> EthicsDeontologyTeachLesson
                 "Can seem too rigid in extreme cases (e.g., lying to a would-be murderer).",
                 "Struggles with conflicting duties (e.g., promise-keeping vs. preventing harm).",
             ],
-        ).model_dump(),
+        ),
         EthicsDeontologyTeachEntry(
             title="Rule Deontology and Common-Sense Morality",
             description=(
@@ -2616,7 +2616,7 @@ async def philosophy_ethics_l3_deontology_teach() -> EthicsDeontologyTeachLesson
                 "Can be unclear which rules are truly fundamental and how to resolve conflicts between them.",
                 "May seem insensitive to context when strict rule-following leads to bad outcomes.",
             ],
-        ).model_dump(),
+        ),
         EthicsDeontologyTeachEntry(
             title="Rights-Based Deontology",
             description=(
@@ -2635,7 +2635,7 @@ async def philosophy_ethics_l3_deontology_teach() -> EthicsDeontologyTeachLesson
                 "Can lead to 'rights conflicts' where different rights pull in different directions.",
                 "May still require some view about which consequences matter when rights conflict.",
             ],
-        ).model_dump(),
+        ),
     ]
 
     strengths = [
@@ -2759,7 +2759,7 @@ async def philosophy_ethics_l3_virtue_teach() -> EthicsVirtueTeachLesson:
         "Practical wisdom: Good judgment (phronesis) is required to balance virtues in concrete situations.",
     ]
 
-    variants: list[dict[str, Any]] = [
+    variants: list[EthicsVirtueTeachEntry] = [
         EthicsVirtueTeachEntry(
             title="Aristotelian Virtue Ethics",
             description=(
@@ -2779,7 +2779,7 @@ async def philosophy_ethics_l3_virtue_teach() -> EthicsVirtueTeachLesson:
                 "Can seem vague: does not always give a clear answer in specific cases.",
                 "Depends heavily on a particular view of human nature and flourishing.",
             ],
-        ).model_dump(),
+        ),
         EthicsVirtueTeachEntry(
             title="Care of Self and Practices of Character",
             description=(
@@ -2798,7 +2798,7 @@ async def philosophy_ethics_l3_virtue_teach() -> EthicsVirtueTeachLesson:
                 "Risk of becoming self-focused or moralistic if not guided by concern for others.",
                 "Can underplay structural injustices that shape individual character.",
             ],
-        ).model_dump(),
+        ),
         EthicsVirtueTeachEntry(
             title="Contemporary Character and Moral Psychology",
             description=(
@@ -2817,7 +2817,7 @@ async def philosophy_ethics_l3_virtue_teach() -> EthicsVirtueTeachLesson:
                 "Some empirical findings suggest people are more influenced by situations than stable character traits.",
                 "Raises questions about how stable and reliable virtues really are.",
             ],
-        ).model_dump(),
+        ),
     ]
 
     strengths = [
@@ -3046,7 +3046,7 @@ async def philosophy_ethics_l3_four_lens(
         ),
     ]
 
-    return EthicsFourLensResponse(
+    return EthicsFourLensResponse.model_construct(
         original_dilemma=dilemma,
         summaries=summaries,
         consequentialism=conseq_result,
@@ -3142,7 +3142,7 @@ def build_meta_perspectives(
         points_of_tension=tension_points,
     )
 
-    return EthicsMetaPerspectivesResponse(
+    return EthicsMetaPerspectivesResponse.model_construct(
         original_dilemma=four_lens.original_dilemma,
         legalistic=legalistic,
         relational=relational,
@@ -3358,7 +3358,7 @@ async def philosophy_lane1_planner(
 
     if mode == PhilosophyLane1Mode.TEACH_WHAT_IS_PHILOSOPHY:
         lesson = await philosophy_lane1_what_is_philosophy()
-        return PhilosophyLane1PlannerResponse(
+        return PhilosophyLane1PlannerResponse.model_construct(
             mode=mode,
             result=lesson.model_dump(),
         )
@@ -3368,14 +3368,14 @@ async def philosophy_lane1_planner(
         question_text = payload.get("question_text", "")
         practice_req = PhilosophyPracticeRequest(question_text=question_text)
         practice_resp = await philosophy_lane1_practice(practice_req)
-        return PhilosophyLane1PlannerResponse(
+        return PhilosophyLane1PlannerResponse.model_construct(
             mode=mode,
             result=practice_resp.model_dump(),
         )
 
     if mode == PhilosophyLane1Mode.TEACH_ARGUMENT_STRUCTURE:
         lesson = await philosophy_lane1_argument_structure()
-        return PhilosophyLane1PlannerResponse(
+        return PhilosophyLane1PlannerResponse.model_construct(
             mode=mode,
             result=lesson.model_dump(),
         )
@@ -3385,13 +3385,13 @@ async def philosophy_lane1_planner(
         text = payload.get("text", "")
         practice_req = PhilosophyArgumentPracticeRequest(text=text)
         practice_resp = await philosophy_lane1_argument_practice(practice_req)
-        return PhilosophyLane1PlannerResponse(
+        return PhilosophyLane1PlannerResponse.model_construct(
             mode=mode,
             result=practice_resp.model_dump(),
         )
 
     # Fallback (should not happen if enum is exhaustive)
-    return PhilosophyLane1PlannerResponse(
+    return PhilosophyLane1PlannerResponse.model_construct(
         mode=mode,
         result={"error": "Unsupported mode"},
     )
@@ -3411,7 +3411,7 @@ async def philosophy_lane2_planner(
 
     if mode == PhilosophyLane2Mode.TEACH_CORE_BRANCHES:
         lesson = await philosophy_lane2_core_branches()
-        return PhilosophyLane2PlannerResponse(
+        return PhilosophyLane2PlannerResponse.model_construct(
             mode=mode,
             result=lesson.model_dump(),
         )
@@ -3421,12 +3421,12 @@ async def philosophy_lane2_planner(
         question_text = payload.get("question_text", "")
         practice_req = PhilosophyBranchPracticeRequest(question_text=question_text)
         practice_resp = await philosophy_lane2_core_branches_practice(practice_req)
-        return PhilosophyLane2PlannerResponse(
+        return PhilosophyLane2PlannerResponse.model_construct(
             mode=mode,
             result=practice_resp.model_dump(),
         )
 
-    return PhilosophyLane2PlannerResponse(
+    return PhilosophyLane2PlannerResponse.model_construct(
         mode=mode,
         result={"error": "Unsupported mode"},
     )
@@ -3445,7 +3445,7 @@ async def philosophy_lane3_planner(
 
     if mode == PhilosophyLane3Mode.TEACH_ETHICS_INTRO:
         lesson = await philosophy_lane3_ethics_intro()
-        return PhilosophyLane3PlannerResponse(
+        return PhilosophyLane3PlannerResponse.model_construct(
             mode=mode,
             result=lesson.model_dump(),
         )
@@ -3455,12 +3455,12 @@ async def philosophy_lane3_planner(
         dilemma_text = payload.get("dilemma_text", "")
         practice_req = EthicsIntroPracticeRequest(dilemma_text=dilemma_text)
         practice_resp = await philosophy_lane3_ethics_intro_practice(practice_req)
-        return PhilosophyLane3PlannerResponse(
+        return PhilosophyLane3PlannerResponse.model_construct(
             mode=mode,
             result=practice_resp.model_dump(),
         )
 
-    return PhilosophyLane3PlannerResponse(
+    return PhilosophyLane3PlannerResponse.model_construct(
         mode=mode,
         result={"error": "Unsupported mode"},
     )
@@ -3481,7 +3481,7 @@ async def philosophy_lane5_planner(
 
     if mode == PhilosophyLane5Mode.TEACH_CONSEQUENTIALISM_L3:
         lesson = await philosophy_ethics_l3_consequentialism_teach()
-        return PhilosophyLane5PlannerResponse(
+        return PhilosophyLane5PlannerResponse.model_construct(
             mode=mode,
             result=lesson.model_dump(),
         )
@@ -3491,14 +3491,14 @@ async def philosophy_lane5_planner(
         dilemma_text = payload.get("dilemma_text", "")
         practice_req = EthicsConsequentialismPracticeRequest(dilemma_text=dilemma_text)
         practice_resp = await philosophy_ethics_l3_consequentialism_practice(practice_req)
-        return PhilosophyLane5PlannerResponse(
+        return PhilosophyLane5PlannerResponse.model_construct(
             mode=mode,
             result=practice_resp.model_dump(),
         )
 
     if mode == PhilosophyLane5Mode.TEACH_DEONTOLOGY_L3:
         lesson = await philosophy_ethics_l3_deontology_teach()
-        return PhilosophyLane5PlannerResponse(
+        return PhilosophyLane5PlannerResponse.model_construct(
             mode=mode,
             result=lesson.model_dump(),
         )
@@ -3508,14 +3508,14 @@ async def philosophy_lane5_planner(
         dilemma_text = payload.get("dilemma_text", "")
         practice_req = EthicsDeontologyPracticeRequest(dilemma_text=dilemma_text)
         practice_resp = await philosophy_ethics_l3_deontology_practice(practice_req)
-        return PhilosophyLane5PlannerResponse(
+        return PhilosophyLane5PlannerResponse.model_construct(
             mode=mode,
             result=practice_resp.model_dump(),
         )
 
     if mode == PhilosophyLane5Mode.TEACH_VIRTUE_L3:
         lesson = await philosophy_ethics_l3_virtue_teach()
-        return PhilosophyLane5PlannerResponse(
+        return PhilosophyLane5PlannerResponse.model_construct(
             mode=mode,
             result=lesson.model_dump(),
         )
@@ -3525,14 +3525,14 @@ async def philosophy_lane5_planner(
         dilemma_text = payload.get("dilemma_text", "")
         practice_req = EthicsVirtuePracticeRequest(dilemma_text=dilemma_text)
         practice_resp = await philosophy_ethics_l3_virtue_practice(practice_req)
-        return PhilosophyLane5PlannerResponse(
+        return PhilosophyLane5PlannerResponse.model_construct(
             mode=mode,
             result=practice_resp.model_dump(),
         )
 
     if mode == PhilosophyLane5Mode.TEACH_CARE_L3:
         lesson = await philosophy_ethics_l3_care_teach()
-        return PhilosophyLane5PlannerResponse(
+        return PhilosophyLane5PlannerResponse.model_construct(
             mode=mode,
             result=lesson.model_dump(),
         )
@@ -3542,12 +3542,12 @@ async def philosophy_lane5_planner(
         dilemma_text = payload.get("dilemma_text", "")
         practice_req = EthicsCarePracticeRequest(dilemma_text=dilemma_text)
         practice_resp = await philosophy_ethics_l3_care_practice(practice_req)
-        return PhilosophyLane5PlannerResponse(
+        return PhilosophyLane5PlannerResponse.model_construct(
             mode=mode,
             result=practice_resp.model_dump(),
         )
 
-    return PhilosophyLane5PlannerResponse(
+    return PhilosophyLane5PlannerResponse.model_construct(
         mode=mode,
         result={"error": "Unsupported mode"},
     )
@@ -3566,7 +3566,7 @@ async def philosophy_lane4_planner(
 
     if mode == PhilosophyLane4Mode.TEACH_ETHICS_DIGITAL:
         lesson = await philosophy_lane4_ethics_digital()
-        return PhilosophyLane4PlannerResponse(
+        return PhilosophyLane4PlannerResponse.model_construct(
             mode=mode,
             result=lesson.model_dump(),
         )
@@ -3592,12 +3592,12 @@ async def philosophy_lane4_planner(
             context_tags=context_tags,
         )
         practice_resp = await philosophy_lane4_ethics_digital_practice(practice_req)
-        return PhilosophyLane4PlannerResponse(
+        return PhilosophyLane4PlannerResponse.model_construct(
             mode=mode,
             result=practice_resp.model_dump(),
         )
 
-    return PhilosophyLane4PlannerResponse(
+    return PhilosophyLane4PlannerResponse.model_construct(
         mode=mode,
         result={"error": "Unsupported mode"},
     )
@@ -6338,9 +6338,9 @@ async def philosophy_k8_logic_seeds_planner(
     )
     practice_resp = await philosophy_k8_logic_seeds_practice(practice_req)
 
-    return K8LogicPlannerResponse(
+    return K8LogicPlannerResponse.model_construct(
         original_question=request.question_text,
-        lesson=lesson.model_dump(),
+        lesson=lesson,
         practice=practice_resp,
     )
 
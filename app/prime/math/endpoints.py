@@ -52,6 +52,9 @@ from app.prime.curriculum.math_concepts import (
     get_geometry_early_foundations,
     get_geometry_early_foundations_path,
     get_geometry_early_operations,
+    get_number_arithmetic_foundation_concept_index,
+    get_prealgebra_equations_basics_concept_index,
+    get_geometry_early_foundations_concept_index,
 )
 
 from app.prime.math.practice.equations import (
@@ -196,9 +199,6 @@ def _estimate_mastery(total: int, correct: int) -> str:
         return "medium"
     return "low"
 
-def _build_concept_index(concepts: list[MathConcept]) -> dict[str, MathConcept]:
-    return {c.id: c for c in concepts}
-
 # Very simple in-memory attempt log (per process)
 attempt_log: list[dict] = []
 
@@ -2765,8 +2765,7 @@ async def teach_number_arithmetic_foundations():
     """
     # 1) Load path and concepts
     path = get_number_arithmetic_foundation_path()
-    concepts = get_number_arithmetic_foundation_concepts()
-    by_id = _build_concept_index(concepts)
+    by_id = get_number_arithmetic_foundation_concept_index()
 
     teach_steps: list[TeachStep] = []
 
@@ -2831,8 +2830,7 @@ async def teach_number_arithmetic_foundations():
     """
     # 1) Load path and concepts
     path = get_number_arithmetic_foundation_path()
-    concepts = get_number_arithmetic_foundation_concepts()
-    by_id = _build_concept_index(concepts)
+    by_id = get_number_arithmetic_foundation_concept_index()
 
     teach_steps: list[TeachStep] = []
 
@@ -2897,8 +2895,7 @@ async def teach_geometry_early_foundations():
     """
     # 1) Load path and concepts
     path = get_geometry_early_foundations_path()
-    concepts = get_geometry_early_foundations()
-    by_id = _build_concept_index(concepts)
+    by_id = get_geometry_early_foundations_concept_index()
 
     teach_steps: list[TeachStep] = []
 
@@ -3023,8 +3020,7 @@ async def teach_prealgebra_equations_basics():
     """
     # Load path and concepts
     path = get_prealgebra_equations_basics_path()
-    concepts = get_prealgebra_equations_basics()
-    by_id = _build_concept_index(concepts)
+    by_id = get_prealgebra_equations_basics_concept_index()
 
     teach_steps: list[TeachStep] = []
 
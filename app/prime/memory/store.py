@@ -18,6 +18,7 @@ Graceful degradation:
 from __future__ import annotations
 
 import os
+import threading
 from datetime import datetime, timezone
 from typing import Any
 import uuid
@@ -31,6 +32,12 @@ from app.prime.memory.models import Base, ConversationTurn, EMBEDDING_DIM
 EMBEDDING_MODEL = "text-embedding-3-small"
 
 _pgvector_available = None
+_tables_ready = False
+
+# The store is called from worker threads (asyncio.to_thread in the agent
+# loop), so the one-time pgvector check and schema setup are serialised.
+# Re-entrant because ensure_tables() calls _check_pgvector() while holding it.
+_schema_lock = threading.RLock()
 
 
 def _check_pgvector() -> bool:
@@ -38,20 +45,23 @@ def _check_pgvector() -> bool:
     global _pgvector_available
     if _pgvector_available is not None:
         return _pgvector_available
-    
-    try:
-        from pgvector.sqlalchemy import Vector
-        engine = _get_engine()
-        with engine.connect() as conn:
-            conn.execute(sa.text("CREATE EXTENSION IF NOT EXISTS vector"))
-            conn.commit()
-        _pgvector_available = True
-        print("[memory/store] pgvector extension available")
-        return True
-    except Exception as e:
-        _pgvector_available = False
-        print(f"[memory/store] pgvector unavailable (embeddings disabled): {e}")
-        return False
+
+    with _schema_lock:
+        if _pgvector_available is not None:
+            return _pgvector_available
+        try:
+            from pgvector.sqlalchemy import Vector
+            engine = _get_engine()
+            with engine.connect() as conn:
+                conn.execute(sa.text("CREATE EXTENSION IF NOT EXISTS vector"))
+                conn.commit()
+            _pgvector_available = True
+            print("[memory/store] pgvector extension available")
+            return True
+        except Exception as e:
+            _pgvector_available = False
+            print(f"[memory/store] pgvector unavailable (embeddings disabled): {e}")
+            return False
 
 
 def _get_engine():
@@ -63,28 +73,41 @@ def _get_engine():
 
 
 def ensure_tables():
-    """Create memory tables. Embedding table only created if pgvector available."""
-    engine = _get_engine()
-    
-    # Always create conversation_turns
-    try:
-        with engine.connect() as conn:
-            if _check_pgvector():
-                conn.execute(sa.text("CREATE EXTENSION IF NOT EXISTS vector"))
-            conn.commit()
-    except Exception as e:
-        print(f"[memory/store] Warning: {e}")
-    
-    # Create base tables
-    Base.metadata.create_all(engine)
-    
-    # Create memory_embeddings only if pgvector available
-    if _check_pgvector():
+    """
+    Create memory tables. Embedding table only created if pgvector available.
+
+    Runs once per process; a failed create_all leaves it to be retried.
+    """
+    global _tables_ready
+    if _tables_ready:
+        return
+
+    with _schema_lock:
+        if _tables_ready:
+            return
+        engine = _get_engine()
+
+        # Always create conversation_turns
         try:
-            from app.prime.memory.models import MemoryEmbedding
-            MemoryEmbedding.__table__.create(engine, checkfirst=True)
+            with engine.connect() as conn:
+                if _check_pgvector():
+                    conn.execute(sa.text("CREATE EXTENSION IF NOT EXISTS vector"))
+                conn.commit()
         except Exception as e:
-            print(f"[memory/store] Could not create memory_embeddings: {e}")
+            print(f"[memory/store] Warning: {e}")
+
+        # Create base tables
+        Base.metadata.create_all(engine)
+
+        # Create memory_embeddings only if pgvector available
+        if _check_pgvector():
+            try:
+                from app.prime.memory.models import MemoryEmbedding
+                MemoryEmbedding.__table__.create(engine, checkfirst=True)
+            except Exception as e:
+                print(f"[memory/store] Could not create memory_embeddings: {e}")
+
+        _tables_ready = True
 
 
 def save_conversation_turn(
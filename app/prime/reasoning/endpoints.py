@@ -75,6 +75,7 @@ def find_similar_memory_entries(
     Mirrors the logic of reasoning_memory_query, but used directly by the core.
     """
     matches: list[ReasoningMemoryEntry] = []
+    needle = theme_hint.lower() if theme_hint else None
 
     for entry in iter_memory_entries() or []:
         if domain and entry.tags.domain != domain:
@@ -82,11 +83,11 @@ def find_similar_memory_entries(
         if subdomain and entry.tags.subdomain != subdomain:
             continue
 
-        if theme_hint:
+        if needle:
             theme_text = entry.tags.theme or ""
             task_text = entry.task.natural_language_task or ""
             haystack = (theme_text + " " + task_text).lower()
-            if theme_hint.lower() not in haystack:
+            if needle not in haystack:
                 continue
 
         matches.append(entry)
@@ -966,7 +967,9 @@ async def reasoning_memory_save(
     """
     Save a reasoning core response into the reasoning memory store.
     """
-    entry = ReasoningMemoryEntry(
+    # task/response/tags were validated as part of the request body, so the
+    # entry wraps them without a second validation pass.
+    entry = ReasoningMemoryEntry.model_construct(
         id=request.entry_id,
         task=request.task,
         response=request.response,
@@ -986,6 +989,7 @@ async def reasoning_memory_query(
     Retrieve a small set of similar reasoning traces based on simple tag and text matching.
     """
     matches: list[ReasoningMemoryEntry] = []
+    needle = request.theme_contains.lower() if request.theme_contains else None
 
     for entry in iter_memory_entries() or []:
         if request.domain and entry.tags.domain != request.domain:
@@ -993,11 +997,11 @@ async def reasoning_memory_query(
         if request.subdomain and entry.tags.subdomain != request.subdomain:
             continue
 
-        if request.theme_contains:
+        if needle:
             theme_text = entry.tags.theme or ""
             task_text = entry.task.natural_language_task or ""
             haystack = (theme_text + " " + task_text).lower()
-            if request.theme_contains.lower() not in haystack:
+            if needle not in haystack:
                 continue
 
         matches.append(entry)
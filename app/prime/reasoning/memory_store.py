@@ -1,9 +1,8 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 from typing import Iterable, List, Dict, Any
-import json
-from fastapi.encoders import jsonable_encoder
 from app.prime.curriculum.models import ReasoningMemoryEntry, ReasoningTask
 
 
@@ -23,9 +22,9 @@ EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
 
 def append_memory_entry(entry: ReasoningMemoryEntry) -> None:
     try:
-        data = jsonable_encoder(entry)
+        line = entry.model_dump_json()
         with REASONING_MEMORY_FILE.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(data, ensure_ascii=False) + "\n")
+            f.write(line + "\n")
     except Exception as e:
         print("[memory_store] append_memory_entry error:", repr(e))
 
@@ -42,8 +41,7 @@ def load_memory_entries(limit: int = 200) -> List[ReasoningMemoryEntry]:
             if not line:
                 continue
             try:
-                data = json.loads(line)
-                entries.append(ReasoningMemoryEntry(**data))
+                entries.append(ReasoningMemoryEntry.model_validate_json(line))
             except Exception:
                 continue
     except Exception:
@@ -61,8 +59,7 @@ def iter_memory_entries() -> Iterable[ReasoningMemoryEntry]:
                 if not line:
                     continue
                 try:
-                    data = json.loads(line)
-                    yield ReasoningMemoryEntry(**data)
+                    yield ReasoningMemoryEntry.model_validate_json(line)
                 except Exception:
                     continue
     except Exception:
@@ -72,25 +69,31 @@ def iter_memory_entries() -> Iterable[ReasoningMemoryEntry]:
 # ---------------------------------------------------------------------------
 # Lazy singletons — only loaded when search_corpus() is first called.
 # sentence-transformers pulls in PyTorch (2GB). Never import at module level.
+# search_corpus() runs on worker threads, so first loads are serialised by
+# _singleton_lock (double-checked) to avoid loading the model more than once.
 # ---------------------------------------------------------------------------
 
 _chroma_client = None
 _corpus_collection = None
 _embedding_model = None
+_singleton_lock = threading.Lock()
 
 
 def _get_embedding_model():
     global _embedding_model
-    if _embedding_model is None:
-        try:
-            from sentence_transformers import SentenceTransformer
-            print(f"[memory_store] Loading embedding model: {EMBEDDING_MODEL_NAME}")
-            _embedding_model = SentenceTransformer(EMBEDDING_MODEL_NAME)
-        except ImportError:
-            raise RuntimeError(
-                "sentence-transformers not installed. "
-                "Run: pip install sentence-transformers"
-            )
+    if _embedding_model is not None:
+        return _embedding_model
+    with _singleton_lock:
+        if _embedding_model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+                print(f"[memory_store] Loading embedding model: {EMBEDDING_MODEL_NAME}")
+                _embedding_model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+            except ImportError:
+                raise RuntimeError(
+                    "sentence-transformers not installed. "
+                    "Run: pip install sentence-transformers"
+                )
     return _embedding_model
 
 
@@ -98,18 +101,21 @@ def _get_corpus_collection():
     global _chroma_client, _corpus_collection
     if _corpus_collection is not None:
         return _corpus_collection
-    try:
-        import chromadb
-        from chromadb.config import Settings
-        print(f"[memory_store] Connecting to Chroma at {CORPUS_DB_DIR}")
-        _chroma_client = chromadb.PersistentClient(
-            path=str(CORPUS_DB_DIR),
-            settings=Settings(anonymized_telemetry=False),
-        )
-        _corpus_collection = _chroma_client.get_collection(name=CORPUS_COLLECTION_NAME)
-        return _corpus_collection
-    except Exception as e:
-        raise RuntimeError(f"[memory_store] Chroma unavailable: {e}")
+    with _singleton_lock:
+        if _corpus_collection is not None:
+            return _corpus_collection
+        try:
+            import chromadb
+            from chromadb.config import Settings
+            print(f"[memory_store] Connecting to Chroma at {CORPUS_DB_DIR}")
+            _chroma_client = chromadb.PersistentClient(
+                path=str(CORPUS_DB_DIR),
+                settings=Settings(anonymized_telemetry=False),
+            )
+            _corpus_collection = _chroma_client.get_collection(name=CORPUS_COLLECTION_NAME)
+            return _corpus_collection
+        except Exception as e:
+            raise RuntimeError(f"[memory_store] Chroma unavailable: {e}")
 
 
 def list_any_corpus_docs(limit: int = 3) -> List[Dict[str, Any]]:
@@ -0,0 +1,46 @@
+import pytest
+
+from app.prime.curriculum.math_concepts import (
+    get_geometry_early_foundations,
+    get_geometry_early_foundations_concept_index,
+    get_number_arithmetic_foundation_concept_index,
+    get_number_arithmetic_foundation_concepts,
+    get_prealgebra_equations_basics,
+    get_prealgebra_equations_basics_concept_index,
+)
+from app.prime.curriculum.models import MathConceptId
+
+GROUPS = [
+    (get_number_arithmetic_foundation_concepts, get_number_arithmetic_foundation_concept_index),
+    (get_prealgebra_equations_basics, get_prealgebra_equations_basics_concept_index),
+    (get_geometry_early_foundations, get_geometry_early_foundations_concept_index),
+]
+
+
+@pytest.mark.parametrize(("get_concepts", "get_index"), GROUPS)
+def test_concept_index_is_memoized(get_concepts, get_index):
+    assert get_index() is get_index()
+
+
+@pytest.mark.parametrize(("get_concepts", "get_index"), GROUPS)
+def test_concept_index_covers_its_group(get_concepts, get_index):
+    concepts = get_concepts()
+    index = get_index()
+
+    assert list(index) == [concept.id for concept in concepts]
+    for concept in concepts:
+        assert isinstance(concept.id, MathConceptId)
+        assert index[concept.id] is concept
+        assert index.get(MathConceptId(concept.id.value)) is concept
+
+
+def test_concept_index_is_read_only():
+    index = get_number_arithmetic_foundation_concept_index()
+    with pytest.raises(TypeError):
+        index[MathConceptId.ZERO] = None
+
+
+def test_concept_index_only_sees_its_own_group():
+    index = get_number_arithmetic_foundation_concept_index()
+    geometry_ids = {concept.id for concept in get_geometry_early_foundations()}
+    assert geometry_ids.isdisjoint(index)
@@ -0,0 +1,103 @@
+from datetime import datetime
+
+import pytest
+
+from app.prime.curriculum.models import (
+    ReasoningCoreResponse,
+    ReasoningMemoryEntry,
+    ReasoningOutcomeQuality,
+    ReasoningStep,
+    ReasoningStepKind,
+    ReasoningTask,
+    ReasoningToolCall,
+    ReasoningTrace,
+    ReasoningTraceTag,
+)
+from app.prime.reasoning import memory_store
+
+
+@pytest.fixture
+def memory_file(tmp_path, monkeypatch):
+    path = tmp_path / "reasoning_memory.jsonl"
+    monkeypatch.setattr(memory_store, "REASONING_MEMORY_FILE", path)
+    return path
+
+
+def _entry(entry_id: str) -> ReasoningMemoryEntry:
+    task = ReasoningTask(
+        task_id=entry_id,
+        natural_language_task="Is it wrong to lie to protect a friend? — café test",
+        domain_tag="philosophy",
+        subdomain_tag="ethics",
+        given_facts=["a friend is in danger"],
+        allowed_tools=["philosophy_four_lens"],
+    )
+    trace = ReasoningTrace(
+        steps=[
+            ReasoningStep(
+                index=0,
+                kind=ReasoningStepKind.TOOL_CALL,
+                description="Call the four-lens tool.",
+                inputs=["task"],
+                outputs=["utilitarian view", "kantian view"],
+                tool_call=ReasoningToolCall(
+                    name="philosophy_four_lens",
+                    input_payload={"question": "lie?", "lenses": ["care", "virtue"]},
+                ),
+                confidence=0.86,
+            ),
+        ],
+        overall_confidence=0.8,
+        notes=["stored by test"],
+    )
+    return ReasoningMemoryEntry(
+        id=entry_id,
+        task=task,
+        response=ReasoningCoreResponse(
+            task_id=entry_id,
+            trace=trace,
+            key_conclusions=["It depends on the harm avoided."],
+            open_questions=[],
+        ),
+        tags=ReasoningTraceTag(domain="philosophy", subdomain="ethics", theme="lying"),
+        created_at=datetime(2026, 3, 1, 12, 30, 15, 123456),
+        user_id="raymond",
+        outcome_quality=ReasoningOutcomeQuality.CAUTIOUS,
+    )
+
+
+def test_append_then_load_round_trips(memory_file):
+    first, second = _entry("mem-1"), _entry("mem-2")
+    memory_store.append_memory_entry(first)
+    memory_store.append_memory_entry(second)
+
+    assert len(memory_file.read_text(encoding="utf-8").splitlines()) == 2
+    assert memory_store.load_memory_entries() == [first, second]
+    assert list(memory_store.iter_memory_entries()) == [first, second]
+
+    loaded = memory_store.load_memory_entries()[0]
+    assert loaded.created_at == first.created_at
+    assert loaded.response.trace.steps[0].outputs == ("utilitarian view", "kantian view")
+
+
+def test_corrupt_and_blank_lines_are_skipped(memory_file):
+    good = _entry("mem-ok")
+    memory_store.append_memory_entry(good)
+    with memory_file.open("a", encoding="utf-8") as f:
+        f.write('{"id": "broken", "task": \n')
+        f.write("\n")
+        f.write('{"id": "missing-fields"}\n')
+    memory_store.append_memory_entry(_entry("mem-after"))
+
+    loaded_ids = [e.id for e in memory_store.load_memory_entries()]
+    iter_ids = [e.id for e in memory_store.iter_memory_entries()]
+    assert loaded_ids == iter_ids == ["mem-ok", "mem-after"]
+
+
+def test_load_respects_limit_and_missing_file(memory_file):
+    assert memory_store.load_memory_entries() == []
+    assert list(memory_store.iter_memory_entries()) == []
+
+    for i in range(3):
+        memory_store.append_memory_entry(_entry(f"mem-{i}"))
+    assert [e.id for e in memory_store.load_memory_entries(limit=2)] == ["mem-1", "mem-2"]
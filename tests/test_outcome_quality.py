@@ -0,0 +1,54 @@
+import pytest
+
+from app.prime.curriculum.models import ReasoningOutcomeQuality
+from app.prime.curriculum.outcome_quality import compute_outcome_quality_from_answers
+
+
+def _float_bands(num_questions: int, num_correct: int) -> ReasoningOutcomeQuality:
+    # The original accuracy-ratio formula the band table replaced.
+    if num_questions <= 0:
+        return ReasoningOutcomeQuality.UNKNOWN
+    accuracy = num_correct / num_questions
+    if accuracy >= 0.85:
+        return ReasoningOutcomeQuality.GOOD
+    if accuracy >= 0.5:
+        return ReasoningOutcomeQuality.MIXED
+    return ReasoningOutcomeQuality.BAD
+
+
+@pytest.mark.parametrize(
+    ("num_questions", "num_correct", "expected"),
+    [
+        (0, 0, ReasoningOutcomeQuality.UNKNOWN),
+        (-1, 0, ReasoningOutcomeQuality.UNKNOWN),
+        (1, 0, ReasoningOutcomeQuality.BAD),
+        (1, 1, ReasoningOutcomeQuality.GOOD),
+        (20, 20, ReasoningOutcomeQuality.GOOD),
+        # GOOD boundary at 85%
+        (20, 17, ReasoningOutcomeQuality.GOOD),
+        (20, 16, ReasoningOutcomeQuality.MIXED),
+        (20, 18, ReasoningOutcomeQuality.GOOD),
+        (100, 84, ReasoningOutcomeQuality.MIXED),
+        (100, 85, ReasoningOutcomeQuality.GOOD),
+        # MIXED boundary at 50%
+        (20, 10, ReasoningOutcomeQuality.MIXED),
+        (20, 9, ReasoningOutcomeQuality.BAD),
+        (20, 11, ReasoningOutcomeQuality.MIXED),
+        (100, 49, ReasoningOutcomeQuality.BAD),
+        (100, 50, ReasoningOutcomeQuality.MIXED),
+        # Out-of-range counts land on the end bands
+        (10, 12, ReasoningOutcomeQuality.GOOD),
+        (10, -1, ReasoningOutcomeQuality.BAD),
+    ],
+)
+def test_band_boundaries(num_questions, num_correct, expected):
+    assert compute_outcome_quality_from_answers(num_questions, num_correct) is expected
+    assert _float_bands(num_questions, num_correct) is expected
+
+
+def test_matches_float_formula():
+    for num_questions in range(-2, 121):
+        for num_correct in range(-3, num_questions + 4):
+            assert compute_outcome_quality_from_answers(
+                num_questions, num_correct
+            ) is _float_bands(num_questions, num_correct), (num_questions, num_correct)